@@ -3,20 +3,57 @@ Defines admin display for the `requirements` app
 '''
 
 from django.contrib import admin
+from django.db.models import Q
 
 from reversion.admin import VersionAdmin
 
 from requirements import forms, models
 
 
+class ChangelistDeferMixin:
+    '''
+    Mixin for `ModelAdmin` classes
+
+    Defers the fields listed in `changelist_defer` when fetching entries for the changelist, so
+    large text fields that are not displayed are not loaded for every row
+    '''
+
+    changelist_defer = ()
+
+    def get_queryset(self, request):
+        '''
+        Override superclass `get_queryset` to defer `changelist_defer` fields on the changelist
+        '''
+
+        queryset = super().get_queryset(request)
+
+        if self.is_changelist(request):
+            queryset = queryset.defer(*self.changelist_defer)
+
+        return queryset
+
+    @staticmethod
+    def is_changelist(request):
+        '''
+        Return `True` if `request` is for the admin changelist
+        '''
+
+        return bool(
+            request.resolver_match and
+            (request.resolver_match.url_name or '').endswith('_changelist')
+        )
+
+
 @admin.register(models.Component)
-class ComponentAdmin(VersionAdmin):
+class ComponentAdmin(ChangelistDeferMixin, VersionAdmin):
     '''
     Defines admin display for the `component` model
 
     Implements `django-reversion` functionality
     '''
 
+    changelist_defer = ('description',)
+
 
 @admin.register(models.Unit)
 class UnitAdmin(admin.ModelAdmin):
@@ -28,11 +65,75 @@ class UnitAdmin(admin.ModelAdmin):
 
 
 @admin.register(models.Term)
-class TermAdmin(VersionAdmin):
+class TermAdmin(ChangelistDeferMixin, VersionAdmin):
     '''
     Defines admin display for the `Term` model
 
     Implements `django-reversion` functionality
     '''
 
+    changelist_defer = ('description', 'enumerators')
     form = forms.TermForm
+    list_display = ('name', 'd_type_display', 't_type_display', 'units')
+    list_select_related = ('units',)
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        '''
+        Override superclass `formfield_for_foreignkey` to only offer active `Unit` entries, plus
+        the `Unit` of the `Term` being changed so it can still be saved if that unit is inactive
+        '''
+
+        if db_field.name == 'units':
+            object_id = request.resolver_match.kwargs.get('object_id')
+            units_filter = Q(is_active=True)
+
+            if object_id is not None:
+                units_filter |= Q(term__pk=object_id)
+
+            kwargs['queryset'] = models.Unit.objects.filter(units_filter).distinct()
+
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
+
+@admin.register(models.SysReq)
+class SysReqAdmin(ChangelistDeferMixin, VersionAdmin):
+    '''
+    Defines admin display for the `SysReq` model
+
+    Implements `django-reversion` functionality
+    '''
+
+    changelist_defer = ('req_statement',)
+
+
+@admin.register(models.HighLevelReq)
+class HighLevelReqAdmin(ChangelistDeferMixin, VersionAdmin):
+    '''
+    Defines admin display for the `HighLevelReq` model
+
+    Implements `django-reversion` functionality
+    '''
+
+    changelist_defer = ('req_statement',)
+
+    def formfield_for_manytomany(self, db_field, request, **kwargs):
+        '''
+        Override superclass `formfield_for_manytomany` to only load the `Term` columns needed to
+        render the `term` choices
+        '''
+
+        if db_field.name == 'term':
+            kwargs['queryset'] = models.Term.objects.only('id', 'name')
+
+        return super().formfield_for_manytomany(db_field, request, **kwargs)
+
+
+@admin.register(models.LowLevelReq)
+class LowLevelReqAdmin(ChangelistDeferMixin, VersionAdmin):
+    '''
+    Defines admin display for the `LowLevelReq` model
+
+    Implements `django-reversion` functionality
+    '''
+
+    changelist_defer = ('req_statement',)
@@ -26,8 +26,7 @@ class TermForm(forms.ModelForm):
 
     class Meta:
         model = models.Term
-        fields = ['name', 'd_type', 't_type', 'description', 'value', 'units', 'max_value',
-                  'min_value', 'boolean_false_cond', 'boolean_true_cond']
+        exclude = ['added_user', 'modified_user', 'added_date', 'modified_date', 'removed']
 
     def clean(self):
         '''
@@ -44,15 +43,15 @@ class TermForm(forms.ModelForm):
             cleaned_data['added_user'] = self.current_user
             cleaned_data['modified_user'] = self.current_user
 
-        if cleaned_data['d_type'] == models.Term.BOOLEAN:
-            if not cleaned_data['boolean_false_cond']:
+        if cleaned_data.get('d_type') == models.Term.BOOLEAN:
+            if not cleaned_data.get('boolean_false_cond'):
                 self.add_error('boolean_false_cond', 'This field should be filled.')
 
-            if not cleaned_data['boolean_true_cond']:
+            if not cleaned_data.get('boolean_true_cond'):
                 self.add_error('boolean_true_cond', 'This field should be filled.')
 
-        if cleaned_data['t_type'] == models.Term.CONSTANT:
-            if not cleaned_data['value']:
+        if cleaned_data.get('t_type') == models.Term.CONSTANT:
+            if not cleaned_data.get('value'):
                 self.add_error('value', 'This field should be filled.')
 
         return cleaned_data
@@ -0,0 +1,78 @@
+# Generated by Django 3.1.14 on 2026-10-15 06:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('requirements', '0003_auto_20200501_1454'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='component',
+            name='removed',
+            field=models.BooleanField(db_index=True, default=False),
+        ),
+        migrations.AlterField(
+            model_name='highlevelreq',
+            name='removed',
+            field=models.BooleanField(db_index=True, default=False),
+        ),
+        migrations.AlterField(
+            model_name='lowlevelreq',
+            name='removed',
+            field=models.BooleanField(db_index=True, default=False),
+        ),
+        migrations.AlterField(
+            model_name='sysreq',
+            name='removed',
+            field=models.BooleanField(db_index=True, default=False),
+        ),
+        migrations.AlterField(
+            model_name='term',
+            name='removed',
+            field=models.BooleanField(db_index=True, default=False),
+        ),
+        migrations.AddIndex(
+            model_name='component',
+            index=models.Index(fields=['modified_date'], name='component_modified_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='component',
+            index=models.Index(fields=['added_user', 'removed'], name='component_added_rm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='highlevelreq',
+            index=models.Index(fields=['modified_date'], name='highlevelreq_modified_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='highlevelreq',
+            index=models.Index(fields=['added_user', 'removed'], name='highlevelreq_added_rm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lowlevelreq',
+            index=models.Index(fields=['modified_date'], name='lowlevelreq_modified_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lowlevelreq',
+            index=models.Index(fields=['added_user', 'removed'], name='lowlevelreq_added_rm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sysreq',
+            index=models.Index(fields=['modified_date'], name='sysreq_modified_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sysreq',
+            index=models.Index(fields=['added_user', 'removed'], name='sysreq_added_rm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='term',
+            index=models.Index(fields=['modified_date'], name='term_modified_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='term',
+            index=models.Index(fields=['added_user', 'removed'], name='term_added_rm_idx'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 3.1.14 on 2026-10-15 06:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('requirements', '0004_core_model_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='term',
+            name='enumerators',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='term',
+            name='initial_value',
+            field=models.CharField(blank=True, max_length=140, null=True),
+        ),
+        migrations.AlterField(
+            model_name='term',
+            name='boolean_false_cond',
+            field=models.CharField(blank=True, max_length=140, null=True, verbose_name='Boolean True Condition'),
+        ),
+        migrations.AlterField(
+            model_name='term',
+            name='boolean_true_cond',
+            field=models.CharField(blank=True, max_length=140, null=True, verbose_name='Boolean False Condition'),
+        ),
+        migrations.AlterField(
+            model_name='term',
+            name='max_value',
+            field=models.CharField(blank=True, max_length=140, null=True, verbose_name='Maximum Value'),
+        ),
+        migrations.AlterField(
+            model_name='term',
+            name='min_value',
+            field=models.CharField(blank=True, max_length=140, null=True, verbose_name='Minimum Value'),
+        ),
+    ]
@@ -24,10 +24,14 @@ class CoreModel(models.Model):
     modified_user = models.ForeignKey(
         User, related_name='%(app_label)s_%(class)s_modified',
         on_delete=models.CASCADE)
-    removed = models.BooleanField(default=False)
+    removed = models.BooleanField(default=False, db_index=True)
 
     class Meta:
         abstract = True
+        indexes = [
+            models.Index(fields=['modified_date'], name='%(class)s_modified_idx'),
+            models.Index(fields=['added_user', 'removed'], name='%(class)s_added_rm_idx'),
+        ]
 
 
 @reversion.register()
@@ -41,7 +45,7 @@ class Component(CoreModel):
     name = models.CharField(max_length=140, unique=True)
     description = models.TextField(blank=True, null=True)
 
-    class Meta:
+    class Meta(CoreModel.Meta):
         app_label = 'requirements'
         ordering = ['name']
 
@@ -71,6 +75,25 @@ class Unit(models.Model):
         return self.symbol
 
 
+class TermManager(models.Manager):
+    '''
+    Manager for `Term` entries
+    '''
+
+    def bulk_create(self, objs, *args, **kwargs): # pylint: disable=arguments-differ
+        '''
+        Override superclass `bulk_create` to apply the same field cleanup as `Term.save()`, which
+        is not called for bulk inserts
+        '''
+
+        objs = list(objs)
+
+        for obj in objs:
+            obj.upper_boolean_conds()
+
+        return super().bulk_create(objs, *args, **kwargs)
+
+
 @reversion.register()
 class Term(CoreModel):
     '''
@@ -96,6 +119,7 @@ class Term(CoreModel):
         (INTEGER, 'Integer'),
         (STRING, 'String'),
     )
+    D_TYPE_DISPLAY = dict(D_TYPE_CHOICES)
 
     # Term type choices
     CONSTANT = 0
@@ -111,6 +135,7 @@ class Term(CoreModel):
         (OUTPUT, 'Output'),
         (VARIABLE, 'Variable'),
     )
+    T_TYPE_DISPLAY = dict(T_TYPE_CHOICES)
 
     d_type = models.IntegerField('Data Type', choices=D_TYPE_CHOICES, default=NONE)
     name = models.CharField(max_length=140, unique=True)
@@ -120,7 +145,7 @@ class Term(CoreModel):
                                           null=True)
     boolean_true_cond = models.CharField('Boolean False Condition', max_length=140, blank=True,
                                          null=True)
-    enumerators = models.JsonField(blank=True, null=True)
+    enumerators = models.JSONField(blank=True, null=True)
     description = models.TextField(blank=True, null=True)
     max_value = models.CharField('Maximum Value', max_length=140, blank=True, null=True)
     min_value = models.CharField('Minimum Value', max_length=140, blank=True, null=True)
@@ -128,15 +153,40 @@ class Term(CoreModel):
     initial_value = models.CharField(max_length=140, blank=True, null=True)
     value = models.CharField(max_length=140, blank=True, null=True)
 
-    class Meta:
+    # Fields updated when saving an entry where only the boolean conditions have changed
+    BOOLEAN_COND_UPDATE_FIELDS = [
+        'boolean_false_cond', 'boolean_true_cond', 'modified_date', 'modified_user'
+    ]
+
+    objects = TermManager()
+
+    class Meta(CoreModel.Meta):
         app_label = 'requirements'
         ordering = ['name']
 
-    def save(self, *args, **kwargs): # pylint: disable=signature-differs
+    def d_type_display(self):
         '''
-        Override superclass save to:
-         * make `boolean_false_cond` field string upper if filled
-         * make `boolean_true_cond` field string upper if filled
+        Return the display label for `d_type` from the precomputed `D_TYPE_DISPLAY` lookup
+        '''
+
+        return self.D_TYPE_DISPLAY.get(self.d_type, self.d_type)
+
+    d_type_display.short_description = 'Data Type'
+    d_type_display.admin_order_field = 'd_type'
+
+    def t_type_display(self):
+        '''
+        Return the display label for `t_type` from the precomputed `T_TYPE_DISPLAY` lookup
+        '''
+
+        return self.T_TYPE_DISPLAY.get(self.t_type, self.t_type)
+
+    t_type_display.short_description = 'Term Type'
+    t_type_display.admin_order_field = 't_type'
+
+    def upper_boolean_conds(self):
+        '''
+        Make `boolean_false_cond` and `boolean_true_cond` field strings upper if filled
         '''
 
         if self.boolean_false_cond:
@@ -145,8 +195,109 @@ class Term(CoreModel):
         if self.boolean_true_cond:
             self.boolean_true_cond = self.boolean_true_cond.upper()
 
-        # Call superclass save
-        super().save(*args, **kwargs)
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        '''
+        Override superclass `from_db` to keep the loaded field values, so `save()` can tell which
+        fields have changed
+        '''
+
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values)) # pylint: disable=protected-access
+
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None):
+        '''
+        Override superclass `refresh_from_db` to keep the reloaded field values, so `save()`
+        compares against the database rather than the values first loaded
+        '''
+
+        super().refresh_from_db(using=using, fields=fields)
+
+        # `fields` may also name prefetched relations, which are not snapshot
+        self.snapshot_loaded_values(
+            [field.attname for field in self._meta.concrete_fields
+             if field.name in fields or field.attname in fields]
+            if fields is not None else None
+        )
+
+    def snapshot_loaded_values(self, attnames=None):
+        '''
+        Keep the current values of the `attnames` fields, or all loaded fields if not supplied, as
+        the values held in the database
+
+        Values are kept by reference, so mutable values are not compared by `get_changed_fields()`
+        '''
+
+        if attnames is None:
+            attnames = [field.attname for field in self._meta.concrete_fields]
+
+        instance_values = self.__dict__
+        instance_values.setdefault('_loaded_values', {}).update(
+            (attname, instance_values[attname]) for attname in attnames
+            if attname in instance_values
+        )
+
+    def get_changed_fields(self):
+        '''
+        Return the names of loaded fields whose values differ from those loaded from the database
+
+        Fields holding mutable values, such as `enumerators`, may have been edited in place and are
+        always returned
+        '''
+
+        loaded_values = getattr(self, '_loaded_values', {})
+
+        return [
+            field.name for field in self._meta.concrete_fields
+            if field.attname in self.__dict__ and field.name != 'modified_date' and (
+                field.attname not in loaded_values or
+                isinstance(getattr(self, field.attname), (dict, list)) or
+                loaded_values[field.attname] != getattr(self, field.attname)
+            )
+        ]
+
+    def _do_update(self, base_qs, using, pk_val, values, update_fields, forced_update):
+        '''
+        Override superclass `_do_update` to only update the `BOOLEAN_COND_UPDATE_FIELDS` columns
+        when `save()` has found no other fields have changed
+
+        If no rows are updated, `save()` still falls back to inserting the entry with all fields
+        '''
+
+        if getattr(self, '_update_boolean_conds_only', False):
+            values = [value for value in values if value[0].name in self.BOOLEAN_COND_UPDATE_FIELDS]
+
+        return super()._do_update(base_qs, using, pk_val, values, update_fields, forced_update)
+
+    def save(self, *args, **kwargs): # pylint: disable=signature-differs
+        '''
+        Override superclass save to:
+         * make `boolean_false_cond` field string upper if filled
+         * make `boolean_true_cond` field string upper if filled
+         * only update the `BOOLEAN_COND_UPDATE_FIELDS` columns of an entry loaded from the
+           database if no other fields have changed
+        '''
+
+        self.upper_boolean_conds()
+
+        loaded_values = getattr(self, '_loaded_values', {})
+
+        self._update_boolean_conds_only = ( # pylint: disable=attribute-defined-outside-init
+            not self._state.adding and not args and self.pk is not None and
+            self.pk == loaded_values.get(self._meta.pk.attname) and
+            not kwargs.get('force_insert') and kwargs.get('update_fields') is None and
+            set(self.get_changed_fields()) <= set(self.BOOLEAN_COND_UPDATE_FIELDS)
+        )
+
+        try:
+            # Call superclass save
+            super().save(*args, **kwargs)
+        finally:
+            self._update_boolean_conds_only = False # pylint: disable=attribute-defined-outside-init
+
+        self.snapshot_loaded_values()
 
     def __str__(self):
         return '"{}"'.format(self.name)
@@ -164,12 +315,26 @@ class SysReq(CoreModel):
     component = models.ForeignKey(Component, on_delete=models.CASCADE)
     req_statement = models.TextField('Requirement Statement')
 
-    class Meta:
+    class Meta(CoreModel.Meta):
         app_label = 'requirements'
         verbose_name = 'System Requirement'
         verbose_name_plural = 'System Requirements'
 
 
+class HighLevelReqQuerySet(models.QuerySet):
+    '''
+    QuerySet for `HighLevelReq` entries
+    '''
+
+    def with_related(self):
+        '''
+        Fetch user foreign keys and the `sys_req` and `term` many-to-many relations up front
+        '''
+
+        return self.select_related('added_user', 'modified_user').prefetch_related(
+            'sys_req', 'term')
+
+
 @reversion.register()
 class HighLevelReq(CoreModel):
     '''
@@ -184,12 +349,28 @@ class HighLevelReq(CoreModel):
     sys_req = models.ManyToManyField(SysReq, verbose_name='System Requirement')
     term = models.ManyToManyField(Term, verbose_name='Terms')
 
-    class Meta:
+    objects = HighLevelReqQuerySet.as_manager()
+
+    class Meta(CoreModel.Meta):
         app_label = 'requirements'
         verbose_name = 'High-level Requirement'
         verbose_name_plural = 'High-level Requirements'
 
 
+class LowLevelReqQuerySet(models.QuerySet):
+    '''
+    QuerySet for `LowLevelReq` entries
+    '''
+
+    def with_related(self):
+        '''
+        Fetch user foreign keys and the `high_level_req` and `term` many-to-many relations up front
+        '''
+
+        return self.select_related('added_user', 'modified_user').prefetch_related(
+            'high_level_req', 'term')
+
+
 @reversion.register()
 class LowLevelReq(CoreModel):
     '''
@@ -206,7 +387,9 @@ class LowLevelReq(CoreModel):
     req_statement = models.TextField('Requirement Statement')
     term = models.ManyToManyField(Term, verbose_name='Terms')
 
-    class Meta:
+    objects = LowLevelReqQuerySet.as_manager()
+
+    class Meta(CoreModel.Meta):
         app_label = 'requirements'
         verbose_name = 'Low-level Requirement'
         verbose_name_plural = 'Low-level Requirements'
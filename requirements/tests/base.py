@@ -0,0 +1,16 @@
+'''
+Defines common test case setup for the `requirements` tests
+'''
+
+
+from django.test import TestCase, override_settings
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class RequirementsTestCase(TestCase):
+    '''
+    Base test case for the `requirements` tests
+
+    Uses a fast password hasher, as the default hasher is deliberately slow and makes creating
+    test users the bulk of the test run time
+    '''
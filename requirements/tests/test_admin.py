@@ -0,0 +1,218 @@
+'''
+Defines test cases for `requirements` admin display
+'''
+
+
+from django.contrib.auth.models import User
+
+from requirements import models
+from requirements.tests.base import RequirementsTestCase
+
+
+class AdminQueryCountTests(RequirementsTestCase):
+    '''
+    Defines test cases for the number of queries made by the `requirements` admin changelists
+    '''
+
+    @classmethod
+    def setUpTestData(cls):
+        '''
+        Common setup for the test cases, run once for the class
+        '''
+
+        # Create a superuser to log in to the admin with
+        cls.user = User.objects.create_superuser(
+            username='testadmin', email='testadmin@example.com', password='12345'
+        )
+
+    def setUp(self):
+        '''
+        Common setup for each test case
+        '''
+
+        self.client.force_login(self.user)
+
+    @staticmethod
+    def create_entries(start, count):
+        '''
+        Create `count` entries of each `requirements` model, numbered from `start`
+        '''
+
+        # Create entries with distinct users, so foreign keys cannot be served from one lookup
+        for idx in range(start, start + count):
+            user = User.objects.create_user(username='testuser{}'.format(idx), password='12345')
+            unit = models.Unit.objects.create(
+                name='unit {}'.format(idx), name_plural='units {}'.format(idx),
+                symbol='u{}'.format(idx)
+            )
+            component = models.Component.objects.create(
+                added_user=user, modified_user=user, name='component {}'.format(idx)
+            )
+            term = models.Term.objects.create(
+                added_user=user, modified_user=user, name='my var {}'.format(idx), units=unit
+            )
+            sys_req = models.SysReq.objects.create(
+                added_user=user, component=component, modified_user=user,
+                req_statement='sys req {}'.format(idx)
+            )
+            high_level_req = models.HighLevelReq.objects.create(
+                added_user=user, modified_user=user, req_statement='hlr {}'.format(idx)
+            )
+            high_level_req.sys_req.add(sys_req)
+            high_level_req.term.add(term)
+            low_level_req = models.LowLevelReq.objects.create(
+                added_user=user, modified_user=user, req_statement='llr {}'.format(idx)
+            )
+            low_level_req.high_level_req.add(high_level_req)
+            low_level_req.term.add(term)
+
+    def assert_changelist_num_queries(self, url, num):
+        '''
+        Assert the changelist at `url` makes `num` queries with both 1 and 10 entries
+        '''
+
+        for start, count in [(0, 1), (1, 9)]:
+            self.create_entries(start, count)
+
+            with self.assertNumQueries(num):
+                response = self.client.get(url)
+
+            self.assertEqual(response.status_code, 200)
+
+    def test_term_changelist_num_queries(self):
+        '''
+        `Term` admin changelist should make the same number of queries for 1 and 10 entries
+
+        The `units` column should be joined into the changelist query rather than fetched per row
+        '''
+
+        self.assert_changelist_num_queries('/admin/requirements/term/', 7)
+
+    def test_component_changelist_num_queries(self):
+        '''
+        `Component` admin changelist should make the same number of queries for 1 and 10 entries
+
+        The changelist does not display any related entries, so this guards against regressions
+        if related entries are displayed in future
+        '''
+
+        self.assert_changelist_num_queries('/admin/requirements/component/', 7)
+
+    def test_sysreq_changelist_num_queries(self):
+        '''
+        `SysReq` admin changelist should make the same number of queries for 1 and 10 entries
+
+        The changelist does not display any related entries, so this guards against regressions
+        if related entries are displayed in future
+        '''
+
+        self.assert_changelist_num_queries('/admin/requirements/sysreq/', 7)
+
+    def test_highlevelreq_changelist_num_queries(self):
+        '''
+        `HighLevelReq` admin changelist should make the same number of queries for 1 and 10 entries
+
+        The changelist does not display any related entries, so this guards against regressions
+        if related entries are displayed in future
+        '''
+
+        self.assert_changelist_num_queries('/admin/requirements/highlevelreq/', 7)
+
+    def test_lowlevelreq_changelist_num_queries(self):
+        '''
+        `LowLevelReq` admin changelist should make the same number of queries for 1 and 10 entries
+
+        The changelist does not display any related entries, so this guards against regressions
+        if related entries are displayed in future
+        '''
+
+        self.assert_changelist_num_queries('/admin/requirements/lowlevelreq/', 7)
+
+
+class TermAdminTests(RequirementsTestCase):
+    '''
+    Defines test cases for the `Term` admin display
+    '''
+
+    @classmethod
+    def setUpTestData(cls):
+        '''
+        Common setup for the test cases, run once for the class
+        '''
+
+        # Create a superuser to log in to the admin with
+        cls.user = User.objects.create_superuser(
+            username='testadmin', email='testadmin@example.com', password='12345'
+        )
+
+        cls.active_unit = models.Unit.objects.create(
+            name='ampere', name_plural='amperes', symbol='A'
+        )
+        cls.inactive_unit = models.Unit.objects.create(
+            is_active=False, name='volt', name_plural='volts', symbol='V'
+        )
+        cls.term = models.Term.objects.create(
+            added_user=cls.user, modified_user=cls.user, name='my var', units=cls.inactive_unit
+        )
+
+    def setUp(self):
+        '''
+        Common setup for each test case
+        '''
+
+        self.client.force_login(self.user)
+
+    def test_changelist_shows_type_labels(self):
+        '''
+        `Term` admin changelist should show the `d_type` and `t_type` choice labels
+        '''
+
+        response = self.client.get('/admin/requirements/term/')
+
+        self.assertContains(response, '<td class="field-d_type_display">None</td>', html=True)
+        self.assertContains(
+            response, '<td class="field-t_type_display">Definition</td>', html=True
+        )
+
+    def test_add_view_units_only_active(self):
+        '''
+        `Term` admin add view should only offer active `Unit` entries for `units`
+        '''
+
+        response = self.client.get('/admin/requirements/term/add/')
+
+        units = response.context['adminform'].form.fields['units'].queryset
+
+        self.assertEqual(list(units), [self.active_unit])
+
+    def test_change_view_units_includes_current_unit(self):
+        '''
+        `Term` admin change view should offer active `Unit` entries and the current `units` entry
+        '''
+
+        response = self.client.get('/admin/requirements/term/{}/change/'.format(self.term.pk))
+
+        units = response.context['adminform'].form.fields['units'].queryset
+
+        self.assertEqual(set(units), {self.active_unit, self.inactive_unit})
+
+    def test_change_view_saves_with_inactive_current_unit(self):
+        '''
+        `Term` admin change view should save a `Term` whose `units` entry has been made inactive
+        '''
+
+        post_data = {
+            'd_type': models.Term.NONE, 'name': 'my new var', 't_type': models.Term.DEFINITION,
+            'units': self.inactive_unit.pk
+        }
+
+        response = self.client.post(
+            '/admin/requirements/term/{}/change/'.format(self.term.pk), post_data
+        )
+
+        # Should redirect back to the changelist on a successful save
+        self.assertEqual(response.status_code, 302)
+
+        self.term.refresh_from_db()
+
+        self.assertEqual(self.term.name, 'my new var')
@@ -4,23 +4,24 @@ Defines test cases for `requirements` forms
 
 
 from django.contrib.auth.models import User
-from django.test import TestCase
 
 from requirements import forms, models
+from requirements.tests.base import RequirementsTestCase
 
 
-class TermFormTests(TestCase):
+class TermFormTests(RequirementsTestCase):
     '''
     Defines test cases for the `TermForm` form
     '''
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         '''
-        Common setup for each test case
+        Common setup for the test cases, run once for the class
         '''
 
         # Create a user model for testing
-        self.user = User.objects.create_user(username='testuser', password='12345')
+        cls.user = User.objects.create_user(username='testuser', password='12345')
 
     def test_init_saves_user_to_class(self):
         '''
@@ -32,6 +33,18 @@ class TermFormTests(TestCase):
         # Confirm user has been saved to form
         self.assertEqual(form.current_user, self.user)
 
+    def test_form_excludes_audit_fields(self):
+        '''
+        `TermForm` should not expose the `CoreModel` audit fields
+
+        These are filled from `current_user` or automatically on save
+        '''
+
+        form = forms.TermForm(current_user=self.user)
+
+        for field_name in ['added_user', 'modified_user', 'added_date', 'modified_date', 'removed']:
+            self.assertNotIn(field_name, form.fields)
+
     def test_is_valid_true_default_data(self):
         '''
         `TermForm` `is_valid()` should return true if valid data is supplied
@@ -103,6 +116,23 @@ class TermFormTests(TestCase):
         # Confirm the cleaned data contains `modified_user`
         self.assertEqual(form.cleaned_data['modified_user'], self.user)
 
+    def test_d_type_invalid_is_valid_false(self):
+        '''
+        `TermForm` should return `is_valid` == `False` if `d_type` fails field validation
+
+        `d_type` is removed from the cleaned data by field validation, so the overridden clean
+        method should not error when it is missing
+        '''
+
+        post_data = {
+            'd_type': 'not a type', 't_type': models.Term.DEFINITION, 'name': 'my var'
+        }
+
+        form = forms.TermForm(post_data, current_user=self.user)
+
+        # Should return false as supplied with invalid data
+        self.assertFalse(form.is_valid())
+
     def test_d_type_boolean_conditions_filled_is_valid_true(self):
         '''
         `TermForm` should return `is_valid` == `True` for valid data combinations
@@ -6,12 +6,12 @@ Defines test cases for `requirements` models
 import json
 
 from django.contrib.auth.models import User
-from django.test import TestCase
 
 from requirements import models
+from requirements.tests.base import RequirementsTestCase
 
 
-class UnitTests(TestCase):
+class UnitTests(RequirementsTestCase):
     '''
     Defines test cases for the `Unit` model
     '''
@@ -34,18 +34,19 @@ class UnitTests(TestCase):
         self.assertEqual(str(entry), 'µA')
 
 
-class TermTests(TestCase):
+class TermTests(RequirementsTestCase):
     '''
     Defines test cases for the `Term` model
     '''
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         '''
-        Common setup for each test case
+        Common setup for the test cases, run once for the class
         '''
 
         # Create a user model for testing
-        self.user = User.objects.create_user(username='testuser', password='12345')
+        cls.user = User.objects.create_user(username='testuser', password='12345')
 
     def test_entry_save_makes_boolean_true_condition_upper(self):
         '''
@@ -54,11 +55,12 @@ class TermTests(TestCase):
         If `boolean_true_condition` field is filled, make upper case on save
         '''
 
-        # Create a `Term` entry
-        entry = models.Term.objects.create(
-            added_user=self.user, boolean_true_cond='my true', modified_user=self.user,
-            name='my var'
-        )
+        # Create a `Term` entry, which should only need a single insert
+        with self.assertNumQueries(1):
+            entry = models.Term.objects.create(
+                added_user=self.user, boolean_true_cond='my true', modified_user=self.user,
+                name='my var'
+            )
 
         # should have been made upper case on save
         self.assertEqual(entry.boolean_true_cond, 'MY TRUE')
@@ -70,11 +72,193 @@ class TermTests(TestCase):
         If `boolean_false_condition` field is filled, make upper case on save
         '''
 
-        # Create a `Term` entry
-        entry = models.Term.objects.create(
-            added_user=self.user, boolean_false_cond='my false', modified_user=self.user,
-            name='my var'
-        )
+        # Create a `Term` entry, which should only need a single insert
+        with self.assertNumQueries(1):
+            entry = models.Term.objects.create(
+                added_user=self.user, boolean_false_cond='my false', modified_user=self.user,
+                name='my var'
+            )
 
         # should have been made upper case on save
         self.assertEqual(entry.boolean_false_cond, 'MY FALSE')
+
+    def test_bulk_create_makes_boolean_conditions_upper(self):
+        '''
+        `Term` manager `bulk_create` should make boolean condition field strings upper case
+
+        `save()` is not called for bulk inserts, so the manager should apply the same cleanup
+        '''
+
+        # Create `Term` entries in bulk
+        models.Term.objects.bulk_create([
+            models.Term(added_user=self.user, boolean_false_cond='my false',
+                        boolean_true_cond='my true', modified_user=self.user, name='my var'),
+        ])
+
+        entry = models.Term.objects.get(name='my var')
+
+        # should have been made upper case on bulk create
+        self.assertEqual(entry.boolean_false_cond, 'MY FALSE')
+        self.assertEqual(entry.boolean_true_cond, 'MY TRUE')
+
+    def test_type_display_returns_choice_labels(self):
+        '''
+        `Term` model `d_type_display` and `t_type_display` should return the choice labels
+
+        Labels should match those returned by the Django generated display methods
+        '''
+
+        entry = models.Term(d_type=models.Term.BOOLEAN, t_type=models.Term.CONSTANT)
+
+        self.assertEqual(entry.d_type_display(), entry.get_d_type_display())
+        self.assertEqual(entry.t_type_display(), entry.get_t_type_display())
+
+    def test_entry_save_unchanged_only_updates_boolean_cond_fields(self):
+        '''
+        `Term` model should only update the boolean condition and modified fields when saving an
+        unchanged entry loaded from the database
+        '''
+
+        models.Term.objects.create(added_user=self.user, modified_user=self.user, name='my var')
+        entry = models.Term.objects.get(name='my var')
+
+        with self.assertNumQueries(1) as context:
+            entry.save()
+
+        # Only the `BOOLEAN_COND_UPDATE_FIELDS` columns should be in the update
+        self.assertNotIn('"description"', context.captured_queries[0]['sql'])
+
+    def test_entry_save_only_updates_changed_boolean_cond_fields(self):
+        '''
+        `Term` model should only update the boolean condition and modified fields when saving an
+        entry loaded from the database where only a boolean condition has changed
+
+        Fields changed elsewhere since the entry was loaded should not be overwritten
+        '''
+
+        models.Term.objects.create(added_user=self.user, modified_user=self.user, name='my var')
+        entry = models.Term.objects.get(name='my var')
+
+        # Change `description` behind the loaded entry's back
+        models.Term.objects.filter(pk=entry.pk).update(description='my description')
+
+        entry.boolean_true_cond = 'my true'
+
+        with self.assertNumQueries(1):
+            entry.save()
+
+        entry.refresh_from_db()
+
+        # `boolean_true_cond` should be saved and `description` should be left alone
+        self.assertEqual(entry.boolean_true_cond, 'MY TRUE')
+        self.assertEqual(entry.description, 'my description')
+
+    def test_entry_save_saves_enumerators_edited_in_place(self):
+        '''
+        `Term` model should save `enumerators` edited in place on an entry loaded from the database
+
+        The loaded values are copied, so editing the loaded object should still count as a change
+        '''
+
+        models.Term.objects.create(
+            added_user=self.user, enumerators={'a': 1}, modified_user=self.user, name='my var'
+        )
+        entry = models.Term.objects.get(name='my var')
+
+        entry.enumerators['b'] = 2
+        entry.save()
+
+        entry.refresh_from_db()
+
+        # `enumerators` should have been saved with the added key
+        self.assertEqual(entry.enumerators, {'a': 1, 'b': 2})
+
+    def test_entry_save_after_refresh_compares_refreshed_values(self):
+        '''
+        `Term` model should compare against refreshed values when saving after `refresh_from_db()`
+
+        Setting a field back to the value first loaded should still be saved if the database has
+        changed since
+        '''
+
+        models.Term.objects.create(
+            added_user=self.user, description='A', modified_user=self.user, name='my var'
+        )
+        entry = models.Term.objects.get(name='my var')
+
+        # Change `description` behind the loaded entry's back, then refresh
+        models.Term.objects.filter(pk=entry.pk).update(description='B')
+        entry.refresh_from_db()
+
+        entry.description = 'A'
+        entry.save()
+
+        entry.refresh_from_db()
+
+        # `description` should have been saved
+        self.assertEqual(entry.description, 'A')
+
+    def test_entry_save_other_field_changed_updates_all_fields(self):
+        '''
+        `Term` model should save all fields if a field other than the boolean conditions has
+        changed
+        '''
+
+        models.Term.objects.create(added_user=self.user, modified_user=self.user, name='my var')
+        entry = models.Term.objects.get(name='my var')
+
+        entry.description = 'my description'
+        entry.save()
+
+        entry.refresh_from_db()
+
+        self.assertEqual(entry.description, 'my description')
+
+    def test_entry_save_pk_none_creates_copy(self):
+        '''
+        `Term` model should insert a new entry when an entry loaded from the database is saved with
+        `pk` set to `None`
+        '''
+
+        models.Term.objects.create(added_user=self.user, modified_user=self.user, name='my var')
+        entry = models.Term.objects.get(name='my var')
+
+        entry.pk = None
+        entry.name = 'my copied var'
+        entry.save()
+
+        # Both the original and the copy should exist
+        self.assertEqual(
+            list(models.Term.objects.values_list('name', flat=True)), ['my copied var', 'my var']
+        )
+
+    def test_entry_save_deleted_elsewhere_inserts_entry(self):
+        '''
+        `Term` model should insert an entry loaded from the database again if it has been deleted
+        since it was loaded
+        '''
+
+        models.Term.objects.create(added_user=self.user, modified_user=self.user, name='my var')
+        entry = models.Term.objects.get(name='my var')
+
+        # Delete the entry behind the loaded entry's back
+        models.Term.objects.filter(pk=entry.pk).delete()
+
+        entry.boolean_true_cond = 'my true'
+        entry.save()
+
+        self.assertEqual(models.Term.objects.get(pk=entry.pk).boolean_true_cond, 'MY TRUE')
+
+    def test_refresh_from_db_accepts_prefetched_relation(self):
+        '''
+        `Term` model `refresh_from_db()` should accept prefetched relation names in `fields`
+        '''
+
+        models.Term.objects.create(added_user=self.user, modified_user=self.user, name='my var')
+        entry = models.Term.objects.prefetch_related('highlevelreq_set').get(name='my var')
+
+        # Should clear the prefetched `HighLevelReq` entries without raising
+        entry.refresh_from_db(fields=['highlevelreq'])
+
+        prefetched = entry._prefetched_objects_cache # pylint: disable=protected-access
+        self.assertNotIn('highlevelreq', prefetched)